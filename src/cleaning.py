@@ -7,7 +7,9 @@ while intentionally preserving operational edge cases.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+import numpy as np
 import pandas as pd
 
 
@@ -25,9 +27,19 @@ CANON_MODALITY = {"in_person", "telehealth"}
 # Normalization helpers
 # ----------------------------
 
+def _is_missing(raw_value: object) -> bool:
+    """Scalar missing check (None, NaN, pd.NA, NaT) without pd.isna's array dispatch."""
+    return (
+        raw_value is None
+        or raw_value is pd.NA
+        or raw_value is pd.NaT
+        or (isinstance(raw_value, float) and raw_value != raw_value)
+    )
+
+
 def _norm_text(raw_text: object) -> str:
     """Normalize text for matching: lower, strip, collapse spaces, replace hyphens."""
-    if pd.isna(raw_text):
+    if _is_missing(raw_text):
         return ""
     proc_text = str(raw_text).strip().lower()
     proc_text = proc_text.replace("-", " ")
@@ -35,23 +47,58 @@ def _norm_text(raw_text: object) -> str:
     return proc_text
 
 
+def _norm_text_index(raw: pd.Index) -> pd.Index:
+    """Vectorized `_norm_text` over an Index of raw values (e.g. categorical categories)."""
+    return (
+        raw.astype(str)
+        .str.lower()
+        .str.replace("-", " ", regex=False)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+BOOL_LOOKUP = {
+    # truthy
+    "true": True,
+    "t": True,
+    "yes": True,
+    "y": True,
+    "1": True,
+    # falsy
+    "false": False,
+    "f": False,
+    "no": False,
+    "n": False,
+    "0": False,
+}
+
+
 def parse_boolish(raw_text: object) -> Optional[bool]:
     """
     Parse common boolean-like encodings to True/False.
     Returns None for missing/unknown.
+
+    Row-at-a-time API; `clean_appointments` uses the vectorized
+    `_parse_boolish_series` instead.
     """
-    proc_text = _norm_text(raw_text)
-    if proc_text == "":
-        return None
+    # Already-normalized strings ("yes", "0", ...) skip _norm_text entirely
+    if isinstance(raw_text, str):
+        hit = BOOL_LOOKUP.get(raw_text)
+        if hit is not None:
+            return hit
+    return BOOL_LOOKUP.get(_norm_text(raw_text))
 
-    truthy = {"true", "t", "yes", "y", "1"}
-    falsy = {"false", "f", "no", "n", "0"}
 
-    if proc_text in truthy:
-        return True
-    if proc_text in falsy:
-        return False
-    return None
+def _parse_boolish_series(series: pd.Series) -> pd.Series:
+    """Vectorized `parse_boolish`; returns a nullable boolean Series (<NA> for missing/unknown)."""
+    return (
+        series.astype("string")
+        .str.strip()
+        .str.lower()
+        .map(BOOL_LOOKUP)
+        .astype("boolean")
+    )
 
 
 # ----------------------------
@@ -106,6 +153,22 @@ INSURANCE_TYPE_MAP = {
     "self_pay": "self_pay",
 }
 
+MODALITY_MAP = {
+    "in_person": "in_person",
+    "telehealth": "telehealth",
+}
+
+
+def _normalize_mapping(mapping: dict[str, str]) -> dict[str, str]:
+    """Re-key a mapping by `_norm_text` so lookups can skip per-value normalization."""
+    return {_norm_text(k): v for k, v in mapping.items()}
+
+
+NORMALIZED_STATUS_MAP = _normalize_mapping(STATUS_MAP)
+NORMALIZED_APPOINTMENT_TYPE_MAP = _normalize_mapping(APPOINTMENT_TYPE_MAP)
+NORMALIZED_INSURANCE_TYPE_MAP = _normalize_mapping(INSURANCE_TYPE_MAP)
+NORMALIZED_MODALITY_MAP = _normalize_mapping(MODALITY_MAP)
+
 DATETIME_COLUMNS = [
     "scheduled_start",
     "scheduled_end",
@@ -132,23 +195,134 @@ def summarize_unexpected(series: pd.Series, allowed: set[str]) -> set[str]:
     Return the set of observed non-null values not in the allowed set.
     Intended for debugging/logging, not for raising exceptions yet.
     """
-    observed = {unexpected_value for unexpected_value in series.dropna().astype(str)}
+    # Hash-dedupe first so the str conversion runs once per distinct value
+    observed = set(series.dropna().drop_duplicates().astype(str))
     return observed - allowed
 
-def coerce_datetimes(df: pd.DataFrame, cols: list[str] = DATETIME_COLUMNS) -> pd.DataFrame:
+
+def _normalize_categorical(
+    series: pd.Series, normalized_mapping: dict[str, str], canon: set[str]
+) -> pd.Series:
+    """
+    Map a raw categorical column to canonical values as a pandas Categorical
+    whose categories are exactly the (sorted) canonical vocabulary.
+
+    `normalized_mapping` must be keyed by `_norm_text` output (see `_normalize_mapping`).
+    Only the distinct raw values (the categories) are normalized, with vectorized
+    string ops; row codes are then remapped in a single take.
+    Unknown/missing values become NaN.
+    """
+    cat = series.astype("category")
+    targets = pd.Index(sorted(canon))
+
+    mapped = _norm_text_index(cat.cat.categories).map(normalized_mapping)
+
+    # One slot per raw category, plus a trailing -1 so NaN codes (-1) stay NaN
+    remap = np.append(targets.get_indexer(mapped), -1)
+    codes = remap[cat.cat.codes.to_numpy()]
+
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=targets),
+        index=series.index,
+        name=series.name,
+    )
+
+def normalize_categorical(
+    series: pd.Series, mapping: dict[str, str], canon: Optional[set[str]] = None
+) -> pd.Series:
+    """
+    Column-level counterpart of `map_category`: map a raw text column to a
+    Categorical of canonical values (NaN for missing/unknown).
+
+    Only the distinct raw values are normalized, so cost scales with the number
+    of categories rather than rows. `canon` defaults to the mapping's values.
+    """
+    if canon is None:
+        canon = set(mapping.values())
+    return _normalize_categorical(series, _normalize_mapping(mapping), canon)
+
+
+# Datetime resolutions from coarsest to finest, for picking a common unit
+_DATETIME_UNITS = ("s", "ms", "us", "ns")
+
+
+def _to_datetime(raw: pd.Series) -> pd.Series:
+    """
+    Parse one datetime column: ISO 8601 fast path first, then retry only the
+    leftover non-null values with the slower per-value 'mixed' parser.
+
+    Timezone handling:
+    - Values whose timezone differs from the ISO-parsed values (e.g. naive
+      mm/dd values next to "+02:00" ones) are coerced to NaT like any other
+      invalid parse.
+    - A column whose values carry several different UTC offsets cannot keep a
+      single fixed offset, so its offset-bearing values are converted to UTC;
+      naive values in such a column become NaT.
+    """
+    # Positional index so the retried subset aligns even with duplicate labels
+    values = raw.reset_index(drop=True)
+
+    try:
+        parsed = pd.to_datetime(values, errors="coerce", format="ISO8601", cache=True)
+    except ValueError:
+        # Mixed timezones among ISO values; fall back to pandas' single inferred
+        # format, which coerces the non-conforming values to NaT
+        try:
+            parsed = pd.to_datetime(values, errors="coerce")
+        except ValueError:
+            # Several different offsets: convert to UTC, leaving naive values NaT
+            parsed = pd.to_datetime(values, errors="coerce", format="ISO8601", utc=True)
+            has_offset = values.astype(str).str.contains(r"(?:Z|[+-]\d{2}:?\d{2})$", regex=True)
+            parsed = parsed.where(has_offset)
+
+    retry = parsed.isna() & values.notna()
+    if retry.any():
+        try:
+            retried = pd.to_datetime(values[retry], errors="coerce", format="mixed")
+        except ValueError:
+            # Mixed timezones among the leftovers: leave them as NaT
+            retried = None
+
+        if retried is not None and retried.dt.tz == parsed.dt.tz:
+            # ISO and mixed passes can pick different resolutions; use the finer one
+            unit = max(parsed.dt.unit, retried.dt.unit, key=_DATETIME_UNITS.index)
+            parsed = parsed.dt.as_unit(unit).where(~retry, retried.dt.as_unit(unit))
+
+    parsed.index = raw.index
+    return parsed
+
+
+def coerce_datetimes(
+    df: pd.DataFrame,
+    cols: list[str] = DATETIME_COLUMNS,
+    copy: bool = True,
+    max_workers: Optional[int] = None,
+) -> pd.DataFrame:
     """
     Coerce datetime-like columns to pandas datetime.
 
     - Uses errors='coerce' so invalid parses become NaT (missing)
     - Works with mixed formats (e.g., 'YYYY-mm-dd HH:MM:SS' and 'mm/dd/YYYY HH:MM')
     - Does not drop rows
+    - copy=False updates df in place (for callers that already own a copy)
+    - max_workers > 1 parses columns concurrently in a thread pool (opt-in; only
+      pays off on large frames with multiple cores, since the ISO fast path is
+      the part that can overlap); results are assigned back column by column
     """
-    out = df.copy()
+    out = df.copy() if copy else df
+
+    present = [col for col in cols if col in out.columns]
+    if not present:
+        return out
 
-    for col in cols:
-        if col not in out.columns:
-            continue
-        out[col] = pd.to_datetime(out[col], errors="coerce")
+    if max_workers is not None and max_workers > 1 and len(present) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(present))) as pool:
+            parsed = dict(zip(present, pool.map(_to_datetime, (out[col] for col in present))))
+    else:
+        parsed = {col: _to_datetime(out[col]) for col in present}
+
+    for col, values in parsed.items():
+        out[col] = values
 
     return out
 
@@ -159,48 +333,52 @@ def clean_appointments(df: pd.DataFrame) -> pd.DataFrame:
     This stage:
     - Coerces datetime columns
     - Normalizes categorical columns to canonical vocabularies
-    - Parses boolean-like fields to True/False/None
+    - Parses boolean-like fields to a nullable boolean (True/False/<NA>)
 
     This stage intentionally does NOT:
     - drop rows (except optional dedup in a later step)
     - compute derived metrics (lead/wait/duration)
     """
+    # Single defensive copy; helpers below work on it in place
     out = df.copy()
+    # Column set is fixed until dedup/time features, so build it once
+    present = set(out.columns)
 
     # 1) Coerce datetime columns
-    out = coerce_datetimes(out)
+    out = coerce_datetimes(out, copy=False)
 
     # 2) Normalize categorical fields using explicit mappings
-    if "status" in out.columns:
-        out["status"] = out["status"].map(lambda x: map_category(x, STATUS_MAP))
+    if "status" in present:
+        out["status"] = _normalize_categorical(
+            out["status"], NORMALIZED_STATUS_MAP, CANON_STATUS
+        )
 
-    if "appointment_type" in out.columns:
-        out["appointment_type"] = out["appointment_type"].map(
-            lambda x: map_category(x, APPOINTMENT_TYPE_MAP)
+    if "appointment_type" in present:
+        out["appointment_type"] = _normalize_categorical(
+            out["appointment_type"], NORMALIZED_APPOINTMENT_TYPE_MAP, CANON_APPOINTMENT_TYPE
         )
 
-    if "insurance_type" in out.columns:
-        out["insurance_type"] = out["insurance_type"].map(
-            lambda x: map_category(x, INSURANCE_TYPE_MAP)
+    if "insurance_type" in present:
+        out["insurance_type"] = _normalize_categorical(
+            out["insurance_type"], NORMALIZED_INSURANCE_TYPE_MAP, CANON_INSURANCE_TYPE
         )
 
     # 3) Normalize modality (already clean in generator, but keeping explicit)
-    if "visit_modality" in out.columns:
-        out["visit_modality"] = out["visit_modality"].map(lambda x: map_category(x, {
-            "in_person": "in_person",
-            "telehealth": "telehealth",
-        }))
+    if "visit_modality" in present:
+        out["visit_modality"] = _normalize_categorical(
+            out["visit_modality"], NORMALIZED_MODALITY_MAP, CANON_MODALITY
+        )
 
     # 4) Parse boolean-like fields
     for c in ["follow_up_needed", "follow_up_scheduled"]:
-        if c in out.columns:
-            out[c] = out[c].map(parse_boolish)
+        if c in present:
+            out[c] = _parse_boolish_series(out[c])
 
     # 5) Deduplicate on appointment_id (keep latest created_at)
     out = dedupe_latest_created_at(out)
 
     # 6) Derived time features (minutes)
-    out = add_time_features(out)
+    out = add_time_features(out, copy=False)
 
     return out
 
@@ -209,59 +387,201 @@ def dedupe_latest_created_at(df: pd.DataFrame) -> pd.DataFrame:
     Deduplicate on appointment_id, keeping the row with the latest created_at.
 
     Assumes created_at has already been coerced to datetime.
-    Rows with NaT created_at will sort last.
+    Rows with NaT created_at sort first, so any dated duplicate wins over them;
+    ties keep the row that appears last in the input.
+    The result is ordered by created_at.
     """
     if "appointment_id" not in df.columns:
         return df
 
-    out = df.copy()
-
-    # Sort so the "latest created_at" is last within each appointment_id group
+    # Single-key stable sort puts the latest created_at last per appointment_id;
+    # drop_duplicates then hashes appointment_id instead of sorting on it.
+    # sort_values returns a new frame, so no defensive copy is needed.
+    out = df
     if "created_at" in out.columns:
-        out = out.sort_values(["appointment_id", "created_at"], na_position="first")
-    else:
-        out = out.sort_values(["appointment_id"])
+        out = out.sort_values("created_at", na_position="first", kind="stable")
 
     out = out.drop_duplicates(subset=["appointment_id"], keep="last")
     return out
 
 
-def add_time_features(df: pd.DataFrame) -> pd.DataFrame:
+def _minutes_diff(end: pd.Series, start: pd.Series) -> np.ndarray:
+    """
+    Return (end - start) in minutes as float64, NaN where either side is NaT.
+
+    Works on the underlying DatetimeArrays, so it is independent of the stored
+    resolution (ns/us/...) and timezone, and skips the timedelta Series + .dt
+    accessor round trip.
+    """
+    delta = end.array - start.array
+    return delta / np.timedelta64(1, "m")
+
+
+def add_time_features(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Add derived time features in minutes.
     Assumes datetime columns have already been coerced.
+    copy=False adds the columns to df in place.
     """
-    out = df.copy()
-
-    def minutes(delta):
-        # pandas timedeltas support .dt.total_seconds()
-        return delta.dt.total_seconds() / 60
+    out = df.copy() if copy else df
+    cols = set(out.columns)
 
     # Lead time: scheduled_start - created_at
-    if {"scheduled_start", "created_at"} <= set(out.columns):
-        out["lead_time_minutes"] = minutes(out["scheduled_start"] - out["created_at"])
+    if {"scheduled_start", "created_at"} <= cols:
+        out["lead_time_minutes"] = _minutes_diff(out["scheduled_start"], out["created_at"])
 
     # Wait time: visit_start_time - scheduled_start
-    if {"visit_start_time", "scheduled_start"} <= set(out.columns):
-        out["wait_time_minutes"] = minutes(out["visit_start_time"] - out["scheduled_start"])
+    if {"visit_start_time", "scheduled_start"} <= cols:
+        out["wait_time_minutes"] = _minutes_diff(out["visit_start_time"], out["scheduled_start"])
 
     # Visit duration: visit_end_time - visit_start_time
-    if {"visit_end_time", "visit_start_time"} <= set(out.columns):
-        out["visit_duration_minutes"] = minutes(out["visit_end_time"] - out["visit_start_time"])
+    if {"visit_end_time", "visit_start_time"} <= cols:
+        out["visit_duration_minutes"] = _minutes_diff(out["visit_end_time"], out["visit_start_time"])
 
     return out
 
-def write_processed(df: pd.DataFrame, path: str) -> None:
+# Formats tried in order by the polars pipeline (first successful parse wins).
+# %.f accepts optional fractional seconds; ISO shapes first, then mm/dd/YYYY.
+POLARS_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S%.f",
+    "%Y-%m-%dT%H:%M:%S%.f",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d",
+    "%m/%d/%Y %H:%M:%S%.f",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y",
+)
+
+# ISO shapes with a UTC offset or "Z" (%#z); tried after the naive formats
+POLARS_DATETIME_TZ_FORMATS = (
+    "%Y-%m-%d %H:%M:%S%.f%#z",
+    "%Y-%m-%dT%H:%M:%S%.f%#z",
+    "%Y-%m-%d %H:%M%#z",
+    "%Y-%m-%dT%H:%M%#z",
+)
+
+
+def clean_appointments_polars(lf):
+    """
+    Opt-in polars implementation of `clean_appointments`.
+
+    Takes the validated `polars.LazyFrame` from `data_io.scan_appointments` and
+    runs every step (datetimes, categorical mapping, boolean parsing, dedup,
+    time features) as one fused, multi-threaded query.
+    Returns a `polars.DataFrame`; the pandas path remains the reference
+    implementation. Requires the optional `polars` package.
+
+    Datetimes are parsed with POLARS_DATETIME_FORMATS and
+    POLARS_DATETIME_TZ_FORMATS, which cover the ISO 8601 shapes and mm/dd/YYYY.
+    Unlike `coerce_datetimes`, offset-bearing values ("Z", "+02:00") become
+    naive UTC, and other formats pandas' 'mixed' parser would accept become null.
+    """
+    import polars as pl
+
+    def norm_text(col: str):
+        return (
+            pl.col(col)
+            .str.to_lowercase()
+            .str.replace_all("-", " ", literal=True)
+            .str.replace_all(r"\s+", " ")
+            .str.strip_chars()
+        )
+
+    def categorical(col: str, normalized_mapping: dict[str, str], canon: set[str]):
+        return (
+            norm_text(col)
+            .replace_strict(normalized_mapping, default=None)
+            .cast(pl.Enum(sorted(canon)))
+        )
+
+    def boolish(col: str):
+        return (
+            pl.col(col)
+            .str.strip_chars()
+            .str.to_lowercase()
+            .replace_strict(BOOL_LOOKUP, default=None, return_dtype=pl.Boolean)
+        )
+
+    def parse_datetime(col: str):
+        naive = [
+            pl.col(col).str.to_datetime(fmt, time_unit="us", strict=False)
+            for fmt in POLARS_DATETIME_FORMATS
+        ]
+        # A polars column has one static dtype, so offset values are converted
+        # to UTC and stored naive rather than kept tz-aware as pandas does
+        offset = [
+            pl.col(col)
+            .str.to_datetime(fmt, time_unit="us", strict=False)
+            .dt.replace_time_zone(None)
+            for fmt in POLARS_DATETIME_TZ_FORMATS
+        ]
+        return pl.coalesce(*naive, *offset)
+
+    def minutes_diff(end: str, start: str):
+        return (pl.col(end) - pl.col(start)).dt.total_microseconds() / 60_000_000
+
+    out = (
+        lf.with_columns(
+            *(parse_datetime(c) for c in DATETIME_COLUMNS),
+            categorical("status", NORMALIZED_STATUS_MAP, CANON_STATUS),
+            categorical("appointment_type", NORMALIZED_APPOINTMENT_TYPE_MAP, CANON_APPOINTMENT_TYPE),
+            categorical("insurance_type", NORMALIZED_INSURANCE_TYPE_MAP, CANON_INSURANCE_TYPE),
+            categorical("visit_modality", NORMALIZED_MODALITY_MAP, CANON_MODALITY),
+            boolish("follow_up_needed"),
+            boolish("follow_up_scheduled"),
+        )
+        # Same dedup rule as dedupe_latest_created_at: stable sort, NaT first, keep last
+        .sort("created_at", nulls_last=False, maintain_order=True)
+        .unique(subset="appointment_id", keep="last", maintain_order=True)
+        .with_columns(
+            minutes_diff("scheduled_start", "created_at").alias("lead_time_minutes"),
+            minutes_diff("visit_start_time", "scheduled_start").alias("wait_time_minutes"),
+            minutes_diff("visit_end_time", "visit_start_time").alias("visit_duration_minutes"),
+        )
+    )
+
+    return out.collect()
+
+
+# Rows per Parquet row group; smaller groups give readers finer min/max skipping
+PARQUET_ROW_GROUP_SIZE = 200_000
+
+
+def write_processed(
+    df: pd.DataFrame, path: str, partition_cols: Optional[list[str]] = None
+) -> None:
     """
     Write cleaned appointments dataset to disk.
     Intended for local / downstream consumption (not committed).
+
+    Parquet output is zstd-compressed with dictionary-encoded columns.
+    With partition_cols (e.g. ["clinic_id"]), `path` becomes a dataset
+    directory with one subdirectory per partition value.
     """
     import os
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
     if path.endswith(".parquet"):
-        df.to_parquet(path, index=False)
+        # The partitioned (dataset) writer maps row_group_size to an upper bound
+        # only and flushes small batches as their own groups; set the lower
+        # bound too so groups there are PARQUET_ROW_GROUP_SIZE rows as well
+        group_bounds = (
+            {"min_rows_per_group": PARQUET_ROW_GROUP_SIZE} if partition_cols else {}
+        )
+        df.to_parquet(
+            path,
+            index=False,
+            engine="pyarrow",
+            compression="zstd",
+            use_dictionary=True,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+            partition_cols=partition_cols,
+            **group_bounds,
+        )
     elif path.endswith(".csv"):
+        if partition_cols:
+            raise ValueError("partition_cols is only supported for Parquet output")
         df.to_csv(path, index=False)
     else:
         raise ValueError("Unsupported output format")
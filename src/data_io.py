@@ -1,5 +1,6 @@
 from pathlib import Path
 import pandas as pd
+import pyarrow.dataset as ds
 
 
 REQUIRED_COLUMNS = {
@@ -28,27 +29,99 @@ REQUIRED_COLUMNS = {
     "age_band",
 }
 
+# Low-cardinality text columns, read as category so each raw label is stored once
+CATEGORY_COLUMNS = {
+    "status": "category",
+    "appointment_type": "category",
+    "insurance_type": "category",
+    "visit_modality": "category",
+}
+
+# IDs are prefixed text (APT-..., P-..., PRV-..., CLIN-...), not integers.
+# Provider/clinic have few distinct values, so category gives small int codes
+# for dedup/groupby hashing; appointment/patient ids are near-unique and stay text.
+ID_DTYPES = {
+    "appointment_id": "str",
+    "patient_id": "str",
+    "provider_id": "category",
+    "clinic_id": "category",
+}
+
+# Read hints for read_csv; zip3 stays text so leading zeros survive
+DTYPE_HINTS = {
+    **CATEGORY_COLUMNS,
+    **ID_DTYPES,
+    "zip3": "str",
+}
+
+
+def _require_file(path: str | Path) -> Path:
+    """Return path as a Path, raising FileNotFoundError if it does not exist."""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Appointments file not found: {path}")
+    return path
+
+
+def _check_required_columns(columns) -> None:
+    """Raise ValueError if any of REQUIRED_COLUMNS is absent from columns."""
+    missing = REQUIRED_COLUMNS - set(columns)
+    if missing:
+        raise ValueError(f"Missing required columns: {sorted(missing)}")
+
 
 def load_appointments(path: str | Path) -> pd.DataFrame:
     """
-    Load raw appointments data from CSV and perform basic schema validation.
+    Load raw appointments data from CSV or Parquet and perform basic schema validation.
+
+    Parquet is selected by a `.parquet` suffix; its stored dtypes (e.g. datetimes,
+    categoricals) are kept, so later cleaning steps have less to do.
 
     This function intentionally does NOT clean or transform values.
     It only ensures the dataset can be loaded and has the expected structure.
     """
-    path = Path(path)
+    path = _require_file(path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Appointments file not found: {path}")
-
-    df = pd.read_csv(path)
+    # Only the required columns are read; extra columns are skipped at parse time
+    if path.suffix == ".parquet":
+        # Dataset schema covers single files and hive-partitioned directories
+        schema = ds.dataset(str(path), format="parquet", partitioning="hive").schema
+        present = [c for c in schema.names if c in REQUIRED_COLUMNS]
+        df = pd.read_parquet(path, engine="pyarrow", columns=present)
+    else:
+        df = pd.read_csv(path, usecols=lambda c: c in REQUIRED_COLUMNS, dtype=DTYPE_HINTS)
 
     # Basic shape logging
     if df.empty:
         raise ValueError("Appointments dataset is empty")
 
-    missing = REQUIRED_COLUMNS - set(df.columns)
-    if missing:
-        raise ValueError(f"Missing required columns: {sorted(missing)}")
+    _check_required_columns(df.columns)
 
     return df
+
+
+def scan_appointments(path: str | Path):
+    """
+    Polars counterpart of `load_appointments`: lazily scan a raw appointments CSV
+    with the same checks (file exists, not empty, required columns present).
+
+    All values are read as text and only REQUIRED_COLUMNS are kept.
+    Returns a `polars.LazyFrame` for `clean_appointments_polars`.
+    Requires the optional `polars` package.
+    """
+    import polars as pl
+
+    path = _require_file(path)
+    if path.suffix != ".csv":
+        raise ValueError("scan_appointments supports CSV input only")
+
+    lf = pl.scan_csv(path, infer_schema=False)
+
+    names = lf.collect_schema().names()
+    _check_required_columns(names)
+    lf = lf.select([c for c in names if c in REQUIRED_COLUMNS])
+
+    if lf.head(1).collect().is_empty():
+        raise ValueError("Appointments dataset is empty")
+
+    return lf
@@ -1,8 +1,16 @@
 import pandas as pd
+import pytest
 
-from src.data_io import load_appointments
+from src.data_io import load_appointments, scan_appointments
 from src.cleaning import (
     clean_appointments,
+    clean_appointments_polars,
+    coerce_datetimes,
+    dedupe_latest_created_at,
+    normalize_categorical,
+    summarize_unexpected,
+    write_processed,
+    INSURANCE_TYPE_MAP,
     CANON_STATUS,
     CANON_APPOINTMENT_TYPE,
     CANON_INSURANCE_TYPE,
@@ -67,3 +75,167 @@ def test_datetime_columns_are_datetime64():
 
     for col in dt_cols:
         assert pd.api.types.is_datetime64_any_dtype(df_clean[col]), f"{col} is not datetime"
+
+
+def test_categorical_normalization_maps_messy_variants():
+    df_raw = pd.DataFrame({"status": ["No Show", "no-show", "CANCELLED", " completed ", "bogus", None]})
+    df_clean = clean_appointments(df_raw)
+
+    assert isinstance(df_clean["status"].dtype, pd.CategoricalDtype)
+    assert list(df_clean["status"].cat.categories) == sorted(CANON_STATUS)
+    assert df_clean["status"].tolist()[:4] == ["no_show", "no_show", "canceled", "completed"]
+    assert df_clean["status"].iloc[4:].isna().all()
+
+
+def test_boolish_fields_are_nullable_boolean():
+    df_raw = pd.DataFrame({"follow_up_needed": ["Y", " no", "TRUE", "0", "", None, "maybe"]})
+    df_clean = clean_appointments(df_raw)
+
+    assert df_clean["follow_up_needed"].dtype == "boolean"
+    assert df_clean["follow_up_needed"].tolist() == [True, False, True, False, pd.NA, pd.NA, pd.NA]
+
+
+def test_coerce_datetimes_handles_mixed_formats():
+    df_raw = pd.DataFrame({"scheduled_start": ["2025-10-05 01:15:00", "10/19/2025 12:15", "garbage", None]})
+    df_out = coerce_datetimes(df_raw)
+
+    assert df_out["scheduled_start"].tolist()[:2] == [
+        pd.Timestamp("2025-10-05 01:15:00"),
+        pd.Timestamp("2025-10-19 12:15:00"),
+    ]
+    assert df_out["scheduled_start"].iloc[2:].isna().all()
+
+
+def test_coerce_datetimes_mixed_fallback_with_finer_resolution():
+    # No ISO values, and the retried values need sub-second resolution
+    df_raw = pd.DataFrame({"created_at": ["10/19/2025 12:15", "10/20/2025 12:15:30.5", "garbage"]})
+    df_out = coerce_datetimes(df_raw)
+
+    assert df_out["created_at"].tolist()[:2] == [
+        pd.Timestamp("2025-10-19 12:15:00"),
+        pd.Timestamp("2025-10-20 12:15:30.5"),
+    ]
+    assert pd.isna(df_out["created_at"].iloc[2])
+
+
+def test_coerce_datetimes_mixed_timezones_become_nat():
+    tz_iso_and_naive = pd.DataFrame({"created_at": ["2025-10-19 12:15:00+02:00", "10/19/2025 12:15"]})
+    naive_iso_and_utc = pd.DataFrame({"created_at": ["2025-10-19 12:15:00", "2025-10-19 12:15:00Z"]})
+
+    out_tz = coerce_datetimes(tz_iso_and_naive)["created_at"]
+    out_naive = coerce_datetimes(naive_iso_and_utc)["created_at"]
+
+    assert out_tz.iloc[0] == pd.Timestamp("2025-10-19 12:15:00+02:00")
+    assert pd.isna(out_tz.iloc[1])
+    assert out_naive.iloc[0] == pd.Timestamp("2025-10-19 12:15:00")
+    assert pd.isna(out_naive.iloc[1])
+
+
+def test_coerce_datetimes_several_offsets_convert_to_utc():
+    df_raw = pd.DataFrame({"created_at": ["2025-01-01T10:00+02:00", "2025-01-01T10:00+03:00", "2025-01-01T10:00"]})
+    df_out = coerce_datetimes(df_raw)
+
+    assert df_out["created_at"].tolist()[:2] == [
+        pd.Timestamp("2025-01-01 08:00", tz="UTC"),
+        pd.Timestamp("2025-01-01 07:00", tz="UTC"),
+    ]
+    assert pd.isna(df_out["created_at"].iloc[2])
+
+
+def test_time_features_are_float_for_timezone_aware_columns():
+    df_raw = pd.DataFrame({
+        "created_at": ["2025-10-19T10:00:00Z", "2025-10-19T11:30:00Z"],
+        "scheduled_start": ["2025-10-19T12:00:00Z", None],
+    })
+    df_clean = clean_appointments(df_raw)
+
+    assert df_clean["lead_time_minutes"].dtype == "float64"
+    assert df_clean["lead_time_minutes"].iloc[0] == 120.0
+    assert pd.isna(df_clean["lead_time_minutes"].iloc[1])
+
+
+def test_dedupe_keeps_latest_created_at():
+    df_raw = pd.DataFrame({
+        "appointment_id": ["A", "A", "A", "B"],
+        "created_at": pd.to_datetime(["2025-01-02", None, "2025-01-01", "2025-01-01"]),
+        "marker": ["a_latest", "a_nat", "a_early", "b"],
+    })
+    df_out = dedupe_latest_created_at(df_raw)
+
+    assert sorted(df_out["marker"]) == ["a_latest", "b"]
+
+
+def test_normalize_categorical_accepts_raw_mapping():
+    raw = pd.Series(["Self-Pay", "MCD", "comm", "unknown", None])
+    out = normalize_categorical(raw, INSURANCE_TYPE_MAP, CANON_INSURANCE_TYPE)
+
+    assert out.tolist()[:3] == ["self_pay", "medicaid", "commercial"]
+    assert out.iloc[3:].isna().all()
+    assert list(out.cat.categories) == sorted(CANON_INSURANCE_TYPE)
+
+
+def _assert_polars_matches_pandas(path, utc_columns=()):
+    df_pandas = clean_appointments(load_appointments(path))
+    df_polars = clean_appointments_polars(scan_appointments(path)).to_pandas()
+
+    # The polars path stores offset-bearing timestamps as naive UTC
+    for col in utc_columns:
+        df_pandas[col] = df_pandas[col].dt.tz_convert("UTC").dt.tz_localize(None)
+
+    df_pandas = df_pandas.set_index("appointment_id").sort_index()
+    df_polars = df_polars.set_index("appointment_id").sort_index()
+    assert list(df_polars.columns) == list(df_pandas.columns)
+
+    for col in df_pandas.columns:
+        left = df_pandas[col].astype(object).where(df_pandas[col].notna(), None)
+        right = df_polars[col].astype(object).where(df_polars[col].notna(), None)
+        assert left.tolist() == right.tolist(), col
+
+
+def test_polars_pipeline_matches_pandas():
+    pytest.importorskip("polars")
+
+    _assert_polars_matches_pandas(DATA_PATH)
+
+
+def test_polars_pipeline_matches_pandas_on_iso_variants(tmp_path):
+    pytest.importorskip("polars")
+
+    df_raw = pd.read_csv(DATA_PATH).head(3)
+    df_raw["scheduled_start"] = ["2025-10-20 12:15:30.5", "2025-10-21 08:00:00.25", "2025-10-22 09:30:00"]
+    df_raw["scheduled_end"] = ["2025-10-20T13:15", "2025-10-21T09:00", "2025-10-22T10:30"]
+    df_raw["canceled_at"] = ["2025-10-19T12:15:30Z", "2025-10-20T08:00:00Z", "2025-10-21T09:30:00Z"]
+    path = tmp_path / "iso_variants.csv"
+    df_raw.to_csv(path, index=False)
+
+    df_polars = clean_appointments_polars(scan_appointments(path))
+    for col in ["scheduled_start", "scheduled_end", "canceled_at"]:
+        assert df_polars[col].null_count() == 0, col
+
+    _assert_polars_matches_pandas(path, utc_columns=["canceled_at"])
+
+
+def test_write_processed_partitions_parquet_by_clinic(tmp_path):
+    df_clean = clean_appointments(load_appointments(DATA_PATH))
+    path = str(tmp_path / "appointments_clean.parquet")
+
+    write_processed(df_clean, path, partition_cols=["clinic_id"])
+
+    partitions = sorted(p.name for p in (tmp_path / "appointments_clean.parquet").iterdir())
+    assert partitions == sorted(f"clinic_id={c}" for c in df_clean["clinic_id"].unique())
+    assert len(pd.read_parquet(path)) == len(df_clean)
+
+
+def test_coerce_datetimes_threaded_matches_serial():
+    df_raw = load_appointments(DATA_PATH)
+
+    serial = coerce_datetimes(df_raw)
+    threaded = coerce_datetimes(df_raw, max_workers=4)
+
+    pd.testing.assert_frame_equal(threaded, serial)
+
+
+def test_summarize_unexpected_keeps_astype_str_formatting():
+    dates = pd.Series(pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-01", None]))
+
+    assert summarize_unexpected(dates, {"2025-01-02"}) == {"2025-01-01"}
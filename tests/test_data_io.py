@@ -1,6 +1,70 @@
-from src.data_io import load_appointments
+import pandas as pd
+import pytest
+
+from src.cleaning import write_processed
+from src.data_io import load_appointments, scan_appointments
 
 
 def test_load_appointments_runs():
     df = load_appointments("data/raw/appointments.csv")
     assert len(df) > 0
+
+
+def test_load_appointments_reads_low_cardinality_columns_as_category():
+    df = load_appointments("data/raw/appointments.csv")
+    for col in ["status", "appointment_type", "insurance_type", "visit_modality"]:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+
+
+def test_load_appointments_reads_parquet(tmp_path):
+    df_csv = load_appointments("data/raw/appointments.csv")
+    path = tmp_path / "appointments.parquet"
+    df_csv.to_parquet(path, index=False)
+
+    df = load_appointments(path)
+    pd.testing.assert_frame_equal(df, df_csv)
+
+
+def test_load_appointments_skips_extra_columns_and_keeps_zip3_text(tmp_path):
+    df_csv = load_appointments("data/raw/appointments.csv")
+    df_csv["unused_notes"] = "x"
+    df_csv.loc[0, "zip3"] = "012"
+    path = tmp_path / "appointments.csv"
+    df_csv.to_csv(path, index=False)
+
+    df = load_appointments(path)
+    assert "unused_notes" not in df.columns
+    assert df.loc[0, "zip3"] == "012"
+
+
+def test_load_appointments_reads_low_cardinality_ids_as_category():
+    df = load_appointments("data/raw/appointments.csv")
+    for col in ["provider_id", "clinic_id"]:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+
+
+def test_load_appointments_reads_partitioned_parquet_directory(tmp_path):
+    df_csv = load_appointments("data/raw/appointments.csv")
+    path = str(tmp_path / "appointments.parquet")
+    write_processed(df_csv, path, partition_cols=["clinic_id"])
+
+    df = load_appointments(path)
+    assert len(df) == len(df_csv)
+    assert set(df.columns) == set(df_csv.columns)
+    assert set(df["clinic_id"].astype(str)) == set(df_csv["clinic_id"].astype(str))
+
+
+def test_scan_appointments_validates_like_load_appointments(tmp_path):
+    pytest.importorskip("polars")
+
+    df_csv = pd.read_csv("data/raw/appointments.csv")
+    extra = tmp_path / "extra.csv"
+    df_csv.assign(unused_notes="x").to_csv(extra, index=False)
+    missing = tmp_path / "missing.csv"
+    df_csv.drop(columns=["zip3"]).to_csv(missing, index=False)
+
+    assert "unused_notes" not in scan_appointments(extra).collect_schema().names()
+    with pytest.raises(ValueError, match="zip3"):
+        scan_appointments(missing)
+    with pytest.raises(FileNotFoundError):
+        scan_appointments(tmp_path / "absent.csv")